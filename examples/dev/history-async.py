@@ -5,6 +5,7 @@ from dotenv import load_dotenv
 
 from genai.schemas.history_params import HistoryParams
 from genai.services import ServiceInterface
+from genai.services.connection_manager import ConnectionManager
 
 # make sure you have a .env file under genai root with
 # GENAI_KEY=<your-genai-key>
@@ -31,6 +32,8 @@ async def app() -> None:
     async_history = await service.async_history(params=params)
     async_history = async_history.json()
     print(async_history)
+    # release the pooled connections before the event loop ends
+    await ConnectionManager.aclose()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ from genai.prompt_pattern import PromptPattern
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
+# Concurrent requests (generate_async, tokenize_async) run on an event loop created by the SDK.
+# With the optional ibm-generative-ai[uvloop] extra installed, that loop is a uvloop loop;
+# set GENAI_DISABLE_UVLOOP=1 to keep the default asyncio loop. Your own event loop policy is not changed.
+
 __all__ = ["Model", "Credentials", "Metadata", "PromptPattern", "Options"]
 
 __version__ = v
@@ -1,4 +1,5 @@
 import ast
+import codecs
 import logging
 from collections.abc import Generator
 from typing import Any, Callable, Union
@@ -18,7 +19,7 @@ from genai.schemas.responses import (
     TokenizeResponse,
     TokenizeResult,
 )
-from genai.services import AsyncResponseGenerator, ServiceInterface
+from genai.services import AsyncResponseGenerator, RequestHandler, ServiceInterface
 
 logger = logging.getLogger(__name__)
 
@@ -54,25 +55,34 @@ class Model:
                 self.params.stream = True
                 response_gen = self.service.generate(self.model, batch, self.params, options=options, streaming=True)
 
+                # chunks are raw bytes, a multibyte character can be split across two of them
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
                 for chunk in response_gen:
-                    if "status_code" in chunk:
-                        error = ast.literal_eval(chunk)
-                        raise GenAiException(error)
-
-                    # we assume the returned string from the service is of shape "data: {...}"
-                    response = chunk.replace("data:", "").strip()
-                    try:
-                        parsed_response = ast.literal_eval(response)
-                        for result in parsed_response["results"]:
-                            yield GenerateStreamResponse(**result)
-                    except Exception:
-                        logger.error("Could not parse {} as literal_eval".format(response))
+                    yield from self._parse_stream_text(decoder.decode(chunk))
+                # flush an incomplete trailing sequence as replacement characters
+                yield from self._parse_stream_text(decoder.decode(b"", final=True))
 
         except GenAiException as me:
             raise me
         except Exception as ex:
             raise GenAiException(ex)
 
+    def _parse_stream_text(self, text: str) -> Generator[GenerateStreamResponse]:
+        if not text:
+            return
+        if "status_code" in text:
+            error = ast.literal_eval(text)
+            raise GenAiException(error)
+
+        # we assume the returned string from the service is of shape "data: {...}"
+        response = text.replace("data:", "").strip()
+        try:
+            parsed_response = ast.literal_eval(response)
+            for result in parsed_response["results"]:
+                yield GenerateStreamResponse(**result)
+        except Exception:
+            logger.error("Could not parse {} as literal_eval".format(response))
+
     def generate_as_completed(
         self, prompts: Union[list[str], list[PromptPattern]], options: Options = None
     ) -> Generator[GenerateResponse]:
@@ -102,7 +112,7 @@ class Model:
                     options=options,
                 )
                 if response_gen.status_code == 200:
-                    response_gen = response_gen.json()
+                    response_gen = RequestHandler.decode(response_gen)
                     for y, result in enumerate(response_gen["results"]):
                         result["input_text"] = prompts[i + y]
                     responses = GenerateResponse(**response_gen)
@@ -209,7 +219,7 @@ class Model:
                 )
 
                 if tokenize_response.status_code == 200:
-                    response_json = tokenize_response.json()
+                    response_json = RequestHandler.decode(tokenize_response)
                     for y, result in enumerate(response_json["results"]):
                         result["input_text"] = prompts[i + y]
                     responses = TokenizeResponse(**response_json)
@@ -15,3 +15,6 @@ class Options:
 
     def keys(self):
         return self.d.keys()
+
+    def to_dict(self) -> dict:
+        return self.d
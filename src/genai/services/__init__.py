@@ -1,7 +1,14 @@
 from genai.services.async_generator import AsyncResponseGenerator
 from genai.services.request_handler import RequestHandler
 from genai.services.service_interface import ServiceInterface
+from genai.services.tokenize_batcher import AsyncTokenizeBatcher
 
 from genai.services.prompt_template_manager import PromptTemplateManager  # isort:skip
 
-__all__ = ["RequestHandler", "ServiceInterface", "AsyncResponseGenerator", "PromptTemplateManager"]
+__all__ = [
+    "RequestHandler",
+    "ServiceInterface",
+    "AsyncResponseGenerator",
+    "AsyncTokenizeBatcher",
+    "PromptTemplateManager",
+]
@@ -8,6 +8,7 @@ from genai.exceptions import GenAiException
 from genai.options import Options
 from genai.schemas.responses import GenerateResponse, TokenizeResponse
 from genai.services.connection_manager import ConnectionManager
+from genai.services.request_handler import RequestHandler
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class AsyncResponseGenerator:
         self.accumulator = []
         self._initialize_fn_specific_params()
         self.queue_ = Queue()
-        self.loop_ = asyncio.new_event_loop()
+        self.loop_ = ConnectionManager.new_event_loop()
         return self
 
     def _shutdown(self):
@@ -96,7 +97,7 @@ class AsyncResponseGenerator:
     async def _get_response_json(self, model, inputs, params, options):
         try:
             response_raw = await self.service_fn_(model, inputs, params, options)
-            response = response_raw.json()
+            response = RequestHandler.decode(response_raw)
         except Exception as ex:
             logger.error("Error in _get_response_json {}: {}".format(type(ex), str(ex)))
             response = None
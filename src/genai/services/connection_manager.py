@@ -1,7 +1,16 @@
-import aiolimiter
+import asyncio
+import contextlib
+import logging
+import os
+import time
+
+import aiohttp
 import httpx
 
 from genai.exceptions import GenAiException
+from genai.services.token_bucket import AsyncTokenBucket
+
+logger = logging.getLogger(__name__)
 
 __all__ = ["ConnectionManager"]
 
@@ -13,34 +22,175 @@ class ConnectionManager:
     MAX_RETRIES_TOKENIZE = 3
     MAX_REQ_PER_SECOND_TOKENIZE = 5
     TIMEOUT = 600
+    # Keep idle connections around as long as typical API gateways do (nginx's keepalive_timeout
+    # defaults to 75s), so bursty usage such as polling endpoints every few seconds reuses the
+    # same connection instead of paying a new TCP + TLS handshake per request. Users polling the
+    # /generate or /requests endpoints at intervals benefit most.
+    MAX_KEEPALIVE_CONNECTIONS = 32
+    MAX_CONNECTIONS = 128
+    KEEPALIVE_EXPIRY = 75.0
+    # Opt-in aiohttp transport for high fan-out async generate workloads; httpx stays the default.
+    USE_AIOHTTP_GENERATE = os.getenv("GENAI_ASYNC_GENERATE_BACKEND", "httpx").lower() == "aiohttp"
+    # Run the SDK's own event loops on uvloop when it is installed, unless GENAI_DISABLE_UVLOOP is set.
+    USE_UVLOOP = os.getenv("GENAI_DISABLE_UVLOOP", "").lower() not in ("1", "true", "yes")
+    # Upper bound in seconds for the jittered exponential backoff between retries.
+    MAX_RETRY_BACKOFF = 30
+    # After this many consecutive gateway or unavailable (502/503/504) responses, transport errors or timeouts
+    # on generate, new generate requests fail fast for CIRCUIT_BREAKER_WINDOW seconds instead of piling more
+    # load on the server.
+    # Rate limiting (429) is expected and retried, so it doesn't count. The threshold is kept well above
+    # MAX_CONCURRENT_GENERATE so that a single round of failures across concurrent requests doesn't trip it.
+    CIRCUIT_BREAKER_THRESHOLD = 5 * MAX_CONCURRENT_GENERATE
+    CIRCUIT_BREAKER_WINDOW = 30
 
+    # Generate requests are multiplexed over HTTP/2, so a handful of connections carry many streams.
     generate_limits = httpx.Limits(
-        max_keepalive_connections=MAX_CONCURRENT_GENERATE,
-        max_connections=MAX_CONCURRENT_GENERATE,
+        max_keepalive_connections=8,
+        max_connections=32,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
     )
+    general_limits = httpx.Limits(
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    async_client = None
+    _async_client_loop = None
+    sync_client = httpx.Client(timeout=TIMEOUT, limits=general_limits)
     async_generate_client = None
+    async_generate_session = None
+    _generate_session_loop = None
+    _stale_generate_sessions = []
     async_tokenize_client = None
-    async_tokenize_limiter = aiolimiter.AsyncLimiter(max_rate=MAX_REQ_PER_SECOND_TOKENIZE, time_period=1)
+    _consecutive_failures = 0
+    _last_failure_time = 0.0
+    async_tokenize_limiter = AsyncTokenBucket(
+        capacity=MAX_REQ_PER_SECOND_TOKENIZE, refill_amount=MAX_REQ_PER_SECOND_TOKENIZE, refill_frequency=1.0
+    )
+
+    @staticmethod
+    def new_event_loop() -> asyncio.AbstractEventLoop:
+        """Function to make the event loop used to run concurrent requests.
+
+        Uses uvloop when available (ibm-generative-ai[uvloop] extra) for lower per-await overhead.
+        Only the returned loop is affected, the global event loop policy is left untouched.
+        """
+        if ConnectionManager.USE_UVLOOP:
+            try:
+                import uvloop
+            except ImportError:
+                pass
+            else:
+                return uvloop.new_event_loop()
+        return asyncio.new_event_loop()
 
     @staticmethod
     def make_generate_client():
         """Function to make async httpx client for generate."""
-        if ConnectionManager.async_generate_client is not None:
+        if ConnectionManager.async_generate_client is not None or ConnectionManager.async_generate_session is not None:
             raise GenAiException(ValueError("Can't have two active async_generate_clients"))
+        # Every batch of generate requests starts with a closed circuit.
+        ConnectionManager._consecutive_failures = 0
+        if ConnectionManager.USE_AIOHTTP_GENERATE:
+            # Requests go through the aiohttp session, created lazily by get_generate_session().
+            return
         async_generate_transport = httpx.AsyncHTTPTransport(
-            limits=ConnectionManager.generate_limits, retries=ConnectionManager.MAX_RETRIES_GENERATE
+            http2=True, limits=ConnectionManager.generate_limits, retries=ConnectionManager.MAX_RETRIES_GENERATE
         )
         ConnectionManager.async_generate_client = httpx.AsyncClient(
             transport=async_generate_transport, timeout=ConnectionManager.TIMEOUT_GENERATE
         )
 
+    @staticmethod
+    def get_async_client() -> httpx.AsyncClient:
+        """Function to get the shared async httpx client used for general requests.
+
+        The client is created on first use and recreated when called from a different event loop,
+        since its pooled connections are bound to the loop they were opened on. Callers using the async
+        request helpers from their own event loop should ``await ConnectionManager.aclose()`` before that
+        loop ends to release the pooled connections.
+        """
+        loop = asyncio.get_running_loop()
+        if ConnectionManager.async_client is None or ConnectionManager._async_client_loop is not loop:
+            ConnectionManager.reset_for_event_loop()
+            ConnectionManager.async_client = httpx.AsyncClient(
+                timeout=ConnectionManager.TIMEOUT, limits=ConnectionManager.general_limits
+            )
+            ConnectionManager._async_client_loop = loop
+        return ConnectionManager.async_client
+
+    @staticmethod
+    def reset_for_event_loop():
+        """Function to drop the shared async httpx client so the next request creates one for the current loop.
+
+        A client that was not closed can't be awaited from another loop, so no reference to it is kept and
+        its connections are released when it is garbage collected.
+        """
+        client = ConnectionManager.async_client
+        if client is not None and not client.is_closed:
+            logger.debug("Dropping shared async client left open by a previous event loop")
+        ConnectionManager.async_client = None
+        ConnectionManager._async_client_loop = None
+
+    @staticmethod
+    def generate_circuit_open() -> bool:
+        """Function to check whether generate requests should fail fast."""
+        return (
+            ConnectionManager._consecutive_failures >= ConnectionManager.CIRCUIT_BREAKER_THRESHOLD
+            and time.monotonic() - ConnectionManager._last_failure_time < ConnectionManager.CIRCUIT_BREAKER_WINDOW
+        )
+
+    @staticmethod
+    def record_generate_failure():
+        """Function to record a gateway or unavailable generate response, a transport error or a timeout."""
+        ConnectionManager._consecutive_failures += 1
+        ConnectionManager._last_failure_time = time.monotonic()
+
+    @staticmethod
+    def record_generate_success():
+        """Function to close the generate circuit breaker after a 2xx response."""
+        ConnectionManager._consecutive_failures = 0
+
+    @staticmethod
+    def get_generate_session() -> aiohttp.ClientSession:
+        """Function to get the aiohttp session for generate, creating it on first use.
+
+        The session is created lazily since aiohttp binds its connector to the running event loop,
+        and recreated when called from a different event loop. A session left open by a previous
+        loop is closed on a best-effort basis by delete_generate_client().
+        """
+        loop = asyncio.get_running_loop()
+        session = ConnectionManager.async_generate_session
+        if session is not None and ConnectionManager._generate_session_loop is not loop:
+            if not session.closed:
+                logger.warning(
+                    "aiohttp generate session was not closed before switching event loops, "
+                    "call `await ConnectionManager.delete_generate_client()` before the event loop ends"
+                )
+                ConnectionManager._stale_generate_sessions.append(session)
+            ConnectionManager.async_generate_session = None
+        if ConnectionManager.async_generate_session is None:
+            connector = aiohttp.TCPConnector(
+                limit=ConnectionManager.MAX_CONNECTIONS,
+                limit_per_host=ConnectionManager.MAX_CONNECTIONS // 2,
+                keepalive_timeout=ConnectionManager.KEEPALIVE_EXPIRY,
+                ttl_dns_cache=300,
+            )
+            ConnectionManager.async_generate_session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=ConnectionManager.TIMEOUT_GENERATE)
+            )
+            ConnectionManager._generate_session_loop = loop
+        return ConnectionManager.async_generate_session
+
     @staticmethod
     def make_tokenize_client():
         """Function to make async httpx client for tokenize."""
         if ConnectionManager.async_tokenize_client is not None:
             raise GenAiException(ValueError("Can't have two active async_tokenize_clients"))
-        ConnectionManager.async_tokenize_limiter = aiolimiter.AsyncLimiter(
-            max_rate=ConnectionManager.MAX_REQ_PER_SECOND_TOKENIZE, time_period=1
+        ConnectionManager.async_tokenize_limiter = AsyncTokenBucket(
+            capacity=ConnectionManager.MAX_REQ_PER_SECOND_TOKENIZE,
+            refill_amount=ConnectionManager.MAX_REQ_PER_SECOND_TOKENIZE,
+            refill_frequency=1.0,
         )
         ConnectionManager.async_tokenize_client = httpx.AsyncClient()
 
@@ -50,6 +200,14 @@ class ConnectionManager:
         if ConnectionManager.async_generate_client is not None:
             await ConnectionManager.async_generate_client.aclose()
             ConnectionManager.async_generate_client = None
+        stale, ConnectionManager._stale_generate_sessions = ConnectionManager._stale_generate_sessions, []
+        for session in stale:
+            with contextlib.suppress(Exception):
+                await session.close()
+        if ConnectionManager.async_generate_session is not None:
+            await ConnectionManager.async_generate_session.close()
+            ConnectionManager.async_generate_session = None
+            ConnectionManager._generate_session_loop = None
 
     @staticmethod
     async def delete_tokenize_client():
@@ -57,3 +215,25 @@ class ConnectionManager:
         if ConnectionManager.async_tokenize_client is not None:
             await ConnectionManager.async_tokenize_client.aclose()
             ConnectionManager.async_tokenize_client = None
+        await ConnectionManager.async_tokenize_limiter.close()
+
+    @staticmethod
+    def close():
+        """Function to close the shared sync httpx client.
+
+        A fresh client is installed in its place, so later requests open new connections instead of failing.
+        """
+        ConnectionManager.sync_client.close()
+        ConnectionManager.sync_client = httpx.Client(
+            timeout=ConnectionManager.TIMEOUT, limits=ConnectionManager.general_limits
+        )
+
+    @staticmethod
+    async def aclose():
+        """Function to close the shared async httpx client used for general requests.
+
+        Must be awaited from the event loop the client was used on, before that loop ends.
+        """
+        if ConnectionManager.async_client is not None:
+            await ConnectionManager.async_client.aclose()
+            ConnectionManager.reset_for_event_loop()
@@ -1,16 +1,149 @@
 import asyncio
+import functools
+import json
 import logging
+import random
+from typing import Optional
 
+import aiohttp
 import httpx
+import orjson
 from httpx import Response
 
 from genai._version import version
+from genai.exceptions import GenAiException
 from genai.options import Options
 from genai.services.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["RequestHandler"]
+__all__ = ["RequestHandler", "BoundSender"]
+
+_ORIGIN = f"python-sdk/{version}"
+_RETRY_STATUS = frozenset({httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.TOO_MANY_REQUESTS})
+# Gateway and availability errors count towards the generate circuit breaker, rate limiting doesn't.
+_BREAKER_STATUS = frozenset({httpx.codes.BAD_GATEWAY, httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.GATEWAY_TIMEOUT})
+
+
+@functools.lru_cache(maxsize=16)
+def _auth_headers(key: str, content_type: bool) -> tuple[tuple[str, str], ...]:
+    """Header pairs shared by every request made with the given API key."""
+    headers = (("Authorization", f"Bearer {key}"), ("x-request-origin", _ORIGIN))
+    if content_type:
+        headers += (("Content-Type", "application/json"),)
+    return headers
+
+
+def _build_post_json(key: str, model_id: str, inputs: list, parameters: dict, options: Options) -> tuple[dict, dict]:
+    json_data = {}
+    if model_id is not None:
+        json_data["model_id"] = model_id
+    if inputs is not None:
+        json_data["inputs"] = inputs
+    if parameters is not None:
+        json_data["parameters"] = parameters
+    if options is not None:
+        json_data.update(options.to_dict())
+    return dict(_auth_headers(key, True)), json_data
+
+
+def _build_patch_json(key: str, model_id: str, inputs: list, parameters: dict, options: Options) -> tuple[dict, None]:
+    # The PATCH payload is provided as is by the caller, only the headers are built here.
+    return dict(_auth_headers(key, True)), None
+
+
+def _build_empty(key: str, model_id: str, inputs: list, parameters: dict, options: Options) -> tuple[dict, None]:
+    return dict(_auth_headers(key, False)), None
+
+
+_BUILDERS = {
+    "POST": _build_post_json,
+    "PUT": _build_post_json,
+    "PATCH": _build_patch_json,
+    "GET": _build_empty,
+    "DELETE": _build_empty,
+}
+
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds the server asked us to wait through its Retry-After header, if given as a number."""
+    retry_after = response.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return None
+
+
+def _retry_delay(response, attempt: int) -> float:
+    """Seconds to wait before retrying a throttled or unavailable request.
+
+    Honors the server's Retry-After header when it holds a number of seconds, otherwise falls back
+    to capped exponential backoff with full jitter so concurrent clients don't retry in lockstep.
+    """
+    retry_after = _retry_after(response)
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(ConnectionManager.MAX_RETRY_BACKOFF, 2 ** (attempt + 1)))
+
+
+def _record_generate_status(status_code: int) -> None:
+    """Update the generate circuit breaker with the status of a generate response.
+
+    Only a 2xx closes the circuit, other statuses outside _BREAKER_STATUS leave it unchanged.
+    """
+    if status_code in _BREAKER_STATUS:
+        ConnectionManager.record_generate_failure()
+    elif 200 <= status_code < 300:
+        ConnectionManager.record_generate_success()
+
+
+def _httpx_response(method: str, url: str, response: aiohttp.ClientResponse, content: bytes) -> Response:
+    """Wrap a response received through aiohttp into an httpx.Response, so callers and GenAiException
+    handle both transports the same way.
+
+    aiohttp already decompressed the body, so the Content-Encoding header is dropped.
+    """
+    headers = [(k, v) for k, v in response.headers.items() if k.lower() != "content-encoding"]
+    return Response(response.status, headers=headers, content=content, request=httpx.Request(method, url))
+
+
+class BoundSender:
+    def __init__(self, endpoint: str, key: str) -> None:
+        """Sender of JSON /post requests to a fixed endpoint with a fixed API key.
+
+        Headers are built once, so sending many payloads to the same endpoint skips
+        the per-request header construction done by RequestHandler.post.
+
+        Args:
+            endpoint (str): Remote endpoint to be queried.
+            key (str): API key for authorization.
+        """
+        self.endpoint = endpoint
+        self.headers = httpx.Headers(_auth_headers(key, True))
+
+    def post_json(self, content: bytes) -> Response:
+        """Send an already serialized JSON payload, e.g. from RequestHandler.serialize.
+
+        Args:
+            content (bytes): JSON encoded request body.
+
+        Returns:
+            httpx.Response: Response from the REST API.
+        """
+        return ConnectionManager.sync_client.post(url=self.endpoint, headers=self.headers, content=content)
+
+    async def async_post_json(self, content: bytes) -> Response:
+        """Async version of post_json.
+
+        Args:
+            content (bytes): JSON encoded request body.
+
+        Returns:
+            httpx.Response: Response from the REST API.
+        """
+        return await ConnectionManager.get_async_client().post(self.endpoint, headers=self.headers, content=content)
 
 
 class RequestHandler:
@@ -22,11 +155,11 @@ class RequestHandler:
         inputs: list = None,
         parameters: dict = None,
         options: Options = None,
-    ) -> tuple[dict, dict]:
+    ) -> tuple[dict, Optional[dict]]:
         """General function to build header and/or json_data for /post and /get requests.
 
         Args:
-            method (str): Request type. Currently accepts GET or POST
+            method (str): Request type. One of POST, PUT, PATCH, GET or DELETE.
             key (str): API key for authorization.
             model_id (str, optional): The id of the language model to be queried. Defaults to None.
             inputs (list, optional): List of inputs to be queried. Defaults to None.
@@ -34,35 +167,53 @@ class RequestHandler:
             options (Options, optional): Additional parameters to pass in the query payload. Defaults to None.
 
         Returns:
-            tuple[dict,dict]: Headers, json_data for request
+            tuple[dict,Optional[dict]]: Headers, json_data for request. json_data is None when the request
+            has no body built from these arguments (GET, DELETE and PATCH).
         """
+        builder = _BUILDERS[method]
+        return builder(key, model_id, inputs, parameters, options)
 
-        headers = {
-            "Authorization": f"Bearer {key}",
-            "x-request-origin": f"python-sdk/{version}",
-        }
-        json_data = {}
+    @staticmethod
+    def bind(endpoint: str, key: str) -> BoundSender:
+        """Bind an endpoint and API key once to send many JSON /post requests.
 
-        if method == "POST" or method == "PUT":
-            headers["Content-Type"] = "application/json"
+        Args:
+            endpoint (str): Remote endpoint to be queried.
+            key (str): API key for authorization.
 
-            if model_id is not None:
-                json_data["model_id"] = model_id
+        Returns:
+            BoundSender: Sender reusing the prebuilt headers for every request.
+        """
+        return BoundSender(endpoint, key)
 
-            if inputs is not None:
-                json_data["inputs"] = inputs
+    @staticmethod
+    def serialize(json_data: dict) -> bytes:
+        """Serialize a request payload to JSON bytes with orjson, which is much faster than the stdlib encoder.
 
-            if parameters is not None:
-                json_data["parameters"] = parameters
+        Payloads orjson rejects (e.g. integers over 64 bits) fall back to the stdlib encoder.
 
-            if options is not None:
-                for key in options.keys():
-                    json_data[key] = options[key]
+        Args:
+            json_data (dict): The request payload.
 
-        if method == "PATCH":
-            headers["Content-Type"] = "application/json"
+        Returns:
+            bytes: The JSON encoded payload.
+        """
+        try:
+            return orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return json.dumps(json_data).encode("utf-8")
 
-        return headers, json_data
+    @staticmethod
+    def decode(response: Response):
+        """Decode a JSON response body with orjson, which is much faster than the stdlib decoder on large payloads.
+
+        Args:
+            response (Response): Response from the REST API.
+
+        Returns:
+            The decoded JSON body.
+        """
+        return orjson.loads(response.content)
 
     @staticmethod
     async def async_post(
@@ -88,9 +239,8 @@ class RequestHandler:
         headers, json_data = RequestHandler._metadata(
             method="POST", key=key, model_id=model_id, inputs=inputs, parameters=parameters, options=options
         )
-        response = None
-        async with httpx.AsyncClient(timeout=ConnectionManager.TIMEOUT) as client:
-            response = await client.post(endpoint, headers=headers, json=json_data)
+        content = RequestHandler.serialize(json_data)
+        response = await ConnectionManager.get_async_client().post(endpoint, headers=headers, content=content)
         return response
 
     @staticmethod
@@ -102,15 +252,14 @@ class RequestHandler:
         Args:
             endpoint (str):
             key (str)
-            payload: (dict, optional)
+            json_data (dict, optional): Payload to be sent. Defaults to None.
 
         Returns:
             httpx.Response: Response from the REST API.
         """
-        headers, json_data = RequestHandler._metadata(method="PATCH", key=key)
-        response = None
-        async with httpx.AsyncClient(timeout=ConnectionManager.TIMEOUT) as client:
-            response = await client.patch(endpoint, headers=headers, json=json_data)
+        headers, _ = RequestHandler._metadata(method="PATCH", key=key)
+        content = RequestHandler.serialize(json_data or {})
+        response = await ConnectionManager.get_async_client().patch(endpoint, headers=headers, content=content)
         return response
 
     @staticmethod
@@ -137,13 +286,65 @@ class RequestHandler:
         headers, json_data = RequestHandler._metadata(
             method="POST", key=key, model_id=model_id, inputs=inputs, parameters=parameters, options=options
         )
+        content = RequestHandler.serialize(json_data)
+        # Only new requests are refused while the circuit is open, retries of in-flight ones go on.
+        if ConnectionManager.generate_circuit_open():
+            raise GenAiException(RuntimeError("Too many consecutive failed generate requests, try again later"))
+        response = None
+        for attempt in range(0, ConnectionManager.MAX_RETRIES_GENERATE):
+            try:
+                response = await ConnectionManager.async_generate_client.post(
+                    endpoint, headers=headers, content=content
+                )
+            except httpx.TransportError:
+                ConnectionManager.record_generate_failure()
+                raise
+            _record_generate_status(response.status_code)
+            if response.status_code not in _RETRY_STATUS:
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+        return response
+
+    @staticmethod
+    async def async_generate_aiohttp(
+        endpoint: str,
+        key: str,
+        model_id: str = None,
+        inputs: list = None,
+        parameters: dict = None,
+        options: Options = None,
+    ):
+        """Low level API for async /generate request to REST API using the aiohttp transport.
+
+        Args:
+            endpoint (str): Remote endpoint to be queried.
+            key (str): API key for authorization.
+            model_id (str, optional): The id of the language model to be queried. Defaults to None.
+            inputs (list, optional): List of inputs to be queried. Defaults to None.
+            parameters (dict, optional): Key-value pairs for model parameters. Defaults to None.
+
+        Returns:
+            httpx.Response: Response from the REST API.
+        """
+        headers, json_data = RequestHandler._metadata(
+            method="POST", key=key, model_id=model_id, inputs=inputs, parameters=parameters, options=options
+        )
+        content = RequestHandler.serialize(json_data)
+        session = ConnectionManager.get_generate_session()
+        if ConnectionManager.generate_circuit_open():
+            raise GenAiException(RuntimeError("Too many consecutive failed generate requests, try again later"))
         response = None
         for attempt in range(0, ConnectionManager.MAX_RETRIES_GENERATE):
-            response = await ConnectionManager.async_generate_client.post(endpoint, headers=headers, json=json_data)
-            if response.status_code in [httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.TOO_MANY_REQUESTS]:
-                await asyncio.sleep(2 ** (attempt + 1))
-            else:
-                break
+            try:
+                async with session.post(endpoint, headers=headers, data=content) as r:
+                    response = _httpx_response("POST", endpoint, r, await r.read())
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                ConnectionManager.record_generate_failure()
+                raise
+            _record_generate_status(response.status_code)
+            if response.status_code not in _RETRY_STATUS:
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
         return response
 
     @staticmethod
@@ -170,17 +371,22 @@ class RequestHandler:
         headers, json_data = RequestHandler._metadata(
             method="POST", key=key, model_id=model_id, inputs=inputs, parameters=parameters, options=options
         )
+        content = RequestHandler.serialize(json_data)
         response = None
-        for attempt in range(0, ConnectionManager.MAX_RETRIES_TOKENIZE):
+        for _ in range(0, ConnectionManager.MAX_RETRIES_TOKENIZE):
             # NOTE: We don't retry-fail with httpx since that'd not
             # not respect the ratelimiting below (5 requests per second).
-            # Instead, we do the ratelimiting here with the help of limiter.
+            # Instead, every attempt takes a token from the limiter's token bucket,
+            # which already paces retries, so we only wait extra when the server asks to.
             async with ConnectionManager.async_tokenize_limiter:
-                response = await ConnectionManager.async_tokenize_client.post(endpoint, headers=headers, json=json_data)
-                if response.status_code in [httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.TOO_MANY_REQUESTS]:
-                    await asyncio.sleep(2 ** (attempt + 1))
-                else:
-                    break
+                response = await ConnectionManager.async_tokenize_client.post(
+                    endpoint, headers=headers, content=content
+                )
+            if response.status_code not in _RETRY_STATUS:
+                return response
+            retry_after = _retry_after(response)
+            if retry_after is not None:
+                await asyncio.sleep(retry_after)
         return response
 
     @staticmethod
@@ -196,9 +402,7 @@ class RequestHandler:
             httpx.Response: Response from the REST API.
         """
         headers, _ = RequestHandler._metadata(method="GET", key=key)
-
-        async with httpx.AsyncClient(timeout=ConnectionManager.TIMEOUT) as client:
-            response = await client.get(url=endpoint, headers=headers, params=parameters)
+        response = await ConnectionManager.get_async_client().get(url=endpoint, headers=headers, params=parameters)
         return response
 
     @staticmethod
@@ -224,18 +428,18 @@ class RequestHandler:
         Returns:
             httpx.Response: Response from the REST API.
             or
-            Generator of streamed response payloads from the REST API.
+            Generator of streamed response payloads (bytes) from the REST API.
         """
         headers, json_data = RequestHandler._metadata(
             method="POST", key=key, model_id=model_id, inputs=inputs, parameters=parameters, options=options
         )
 
         if streaming:
-            return RequestHandler.post_stream(endpoint=endpoint, headers=headers, json_data=json_data)
+            return RequestHandler.post_stream_bytes(endpoint=endpoint, headers=headers, json_data=json_data)
         else:
-            with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-                response = s.post(url=endpoint, headers=headers, json=json_data)
-                return response
+            content = RequestHandler.serialize(json_data)
+            response = ConnectionManager.sync_client.post(url=endpoint, headers=headers, content=content)
+            return response
 
     @staticmethod
     def patch(endpoint: str, key: str, json_data: dict = None) -> Response:
@@ -246,23 +450,34 @@ class RequestHandler:
         Args:
             endpoint (str):
             key (str)
-            payload: (dict, optional)
+            json_data (dict, optional): Payload to be sent. Defaults to None.
 
         Returns:
             httpx.Response: Response from the REST API.
         """
-        headers, json_data = RequestHandler._metadata(method="PATCH", key=key)
-
-        with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-            response = s.patch(url=endpoint, headers=headers, json=json_data)
-            return response
+        headers, _ = RequestHandler._metadata(method="PATCH", key=key)
+        content = RequestHandler.serialize(json_data or {})
+        response = ConnectionManager.sync_client.patch(url=endpoint, headers=headers, content=content)
+        return response
 
     @staticmethod
-    def post_stream(endpoint, headers, json_data):
-        with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-            with s.stream(method="POST", url=endpoint, headers=headers, json=json_data) as r:
-                for chunk in r.iter_text():
-                    yield chunk
+    def post_stream_bytes(endpoint, headers, json_data):
+        """Low level API for streamed /post request to REST API.
+
+        Chunks are yielded as bytes, so callers only pay for text decoding when they parse them.
+
+        Args:
+            endpoint (str): Remote endpoint to be queried.
+            headers (dict): Request headers.
+            json_data (dict): Payload to be sent.
+
+        Yields:
+            bytes: Chunks of the streamed response body.
+        """
+        content = RequestHandler.serialize(json_data)
+        with ConnectionManager.sync_client.stream(method="POST", url=endpoint, headers=headers, content=content) as r:
+            for chunk in r.iter_bytes():
+                yield chunk
 
     @staticmethod
     def get(endpoint: str, key: str, parameters: dict = None) -> Response:
@@ -277,9 +492,8 @@ class RequestHandler:
             httpx.Response: Response from the REST API.
         """
         headers, _ = RequestHandler._metadata(method="GET", key=key)
-        with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-            response = s.get(url=endpoint, headers=headers, params=parameters)
-            return response
+        response = ConnectionManager.sync_client.get(url=endpoint, headers=headers, params=parameters)
+        return response
 
     @staticmethod
     def put(endpoint: str, key: str, options: Options = None) -> Response:
@@ -294,9 +508,9 @@ class RequestHandler:
             requests.models.Response: Response from the REST API.
         """
         headers, json_data = RequestHandler._metadata(method="PUT", key=key, options=options)
-        with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-            response = s.put(url=endpoint, headers=headers, json=json_data)
-            return response
+        content = RequestHandler.serialize(json_data)
+        response = ConnectionManager.sync_client.put(url=endpoint, headers=headers, content=content)
+        return response
 
     @staticmethod
     def delete(endpoint: str, key: str, parameters: dict = None) -> Response:
@@ -311,6 +525,5 @@ class RequestHandler:
             requests.models.Response: Response from the REST API.
         """
         headers, _ = RequestHandler._metadata(method="DELETE", key=key)
-        with httpx.Client(timeout=ConnectionManager.TIMEOUT) as s:
-            response = s.delete(url=endpoint, headers=headers, params=parameters)
-            return response
+        response = ConnectionManager.sync_client.delete(url=endpoint, headers=headers, params=parameters)
+        return response
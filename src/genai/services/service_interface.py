@@ -5,6 +5,7 @@ from genai.options import Options
 from genai.routers import PromptTemplateRouter
 from genai.schemas import GenerateParams, HistoryParams, TokenParams
 from genai.services import RequestHandler
+from genai.services.connection_manager import ConnectionManager
 
 
 class ServiceInterface:
@@ -129,6 +130,10 @@ class ServiceInterface:
         try:
             params = ServiceInterface._sanitize_params(params)
             endpoint = self.service_url + ServiceInterface.GENERATE
+            if ConnectionManager.USE_AIOHTTP_GENERATE:
+                return await RequestHandler.async_generate_aiohttp(
+                    endpoint, key=self.key, model_id=model, inputs=inputs, parameters=params, options=options
+                )
             return await RequestHandler.async_generate(
                 endpoint, key=self.key, model_id=model, inputs=inputs, parameters=params, options=options
             )
@@ -0,0 +1,60 @@
+import asyncio
+import contextlib
+
+__all__ = ["AsyncTokenBucket"]
+
+
+class AsyncTokenBucket:
+    def __init__(self, capacity: int, refill_amount: int, refill_frequency: float) -> None:
+        """Instantiates an async token bucket rate limiter.
+
+        The bucket starts full. Every acquire consumes a token, and a background task puts
+        refill_amount tokens back every refill_frequency seconds, never exceeding capacity.
+        The background task is started on first use so the bucket can be created outside an event loop.
+
+        Args:
+            capacity (int): Maximum number of tokens the bucket can hold.
+            refill_amount (int): Number of tokens added back on every refill.
+            refill_frequency (float): Seconds between two refills.
+        """
+        self.capacity = capacity
+        self.refill_amount = refill_amount
+        self.refill_frequency = refill_frequency
+        self._semaphore = None
+        self._consumed = 0
+        self._refill_task = None
+
+    def _start(self):
+        if self._refill_task is None:
+            self._semaphore = asyncio.Semaphore(self.capacity)
+            self._consumed = 0
+            self._refill_task = asyncio.get_running_loop().create_task(self._refill())
+
+    async def _refill(self):
+        while True:
+            await asyncio.sleep(self.refill_frequency)
+            for _ in range(min(self.refill_amount, self._consumed)):
+                self._consumed -= 1
+                self._semaphore.release()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it."""
+        self._start()
+        await self._semaphore.acquire()
+        self._consumed += 1
+
+    async def close(self):
+        """Stop the background refill task."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refill_task
+            self._refill_task = None
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # Tokens are not given back on exit, they only come back through refills.
+        return None
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+
+from genai.exceptions import GenAiException
+from genai.options import Options
+from genai.schemas import TokenParams
+from genai.schemas.responses import TokenizeResponse, TokenizeResult
+from genai.services.connection_manager import ConnectionManager
+from genai.services.request_handler import RequestHandler
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["AsyncTokenizeBatcher"]
+
+
+class AsyncTokenizeBatcher:
+    def __init__(
+        self,
+        model_id,
+        service,
+        params: TokenParams = None,
+        options: Options = None,
+        max_batch: int = 5,
+        max_wait_ms: float = 10,
+    ):
+        """Instantiates the AsyncTokenizeBatcher.
+
+        Concurrent tokenize calls are coalesced into a single /tokenize request carrying all
+        their inputs, which is sent once max_batch inputs are pending or max_wait_ms after
+        the first one arrived. Each caller gets back the result for its own input.
+
+        Args:
+            model_id (ModelType): The type of model to use
+            service (ServiceInterface): The service interface
+            params (TokenParams, optional): Parameters for tokenization. Defaults to None.
+            options (Options, optional): Additional parameters to pass in the query payload. Defaults to None.
+            max_batch (int, optional): Maximum number of inputs per request. Defaults to 5, the
+                maximum number of prompts per request accepted by the service.
+            max_wait_ms (float, optional): Maximum time to wait for more inputs before sending. Defaults to 10.
+        """
+        self.model_id = model_id
+        self.service = service
+        self.params = params
+        self.options = options
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self._owns_client = False
+
+    async def __aenter__(self):
+        if ConnectionManager.async_tokenize_client is None:
+            ConnectionManager.make_tokenize_client()
+            self._owns_client = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._flush()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._owns_client:
+            await ConnectionManager.delete_tokenize_client()
+            self._owns_client = False
+
+    async def tokenize(self, text: str) -> TokenizeResult:
+        """Tokenize a single input as part of the next batch.
+
+        Args:
+            text (str): Input to tokenize.
+
+        Returns:
+            TokenizeResult: The tokenized input
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if len(self._pending) == 0:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch):
+        inputs = [text for text, _ in batch]
+        try:
+            response = await self.service.async_tokenize(self.model_id, inputs, self.params, self.options)
+            if response.status_code != 200:
+                raise GenAiException(response)
+            response_json = RequestHandler.decode(response)
+            for i, result in enumerate(response_json["results"]):
+                result["input_text"] = inputs[i]
+            results = TokenizeResponse(**response_json).results
+        except Exception as e:
+            logger.error("Error in tokenize batch of {} inputs: {}".format(len(inputs), str(e)))
+            error = e if isinstance(e, GenAiException) else GenAiException(e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+        for _, future in batch[len(results) :]:
+            if not future.done():
+                future.set_exception(GenAiException(ValueError("Missing tokenize result for input")))
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from genai import Credentials
@@ -35,8 +36,7 @@ class TestLangChain:
         GENERATE_RESPONSE = SimpleResponse.generate(model=ModelType.FLAN_UL2, inputs=prompts, params=params)
         expected_generated_response = GenerateResponse(**GENERATE_RESPONSE)
 
-        response = MagicMock(status_code=200)
-        response.json.return_value = GENERATE_RESPONSE
+        response = MagicMock(status_code=200, content=orjson.dumps(GENERATE_RESPONSE))
         mocked_post_request.return_value = response
 
         model = LangChainInterface(model=ModelType.FLAN_UL2, params=params, credentials=credentials)
@@ -1,4 +1,3 @@
-import json
 import logging
 import queue
 import random
@@ -6,6 +5,7 @@ import time
 from unittest.mock import AsyncMock
 
 import httpx
+import orjson
 import pytest
 
 from genai.schemas import GenerateParams, ReturnOptions, TokenParams
@@ -141,7 +141,7 @@ class TestAsyncResponseGenerator:
         saved = ConnectionManager.MAX_RETRIES_GENERATE
         ConnectionManager.MAX_RETRIES_GENERATE = 2
         for code in [httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.TOO_MANY_REQUESTS]:
-            httpx_mock.add_response(method="POST", status_code=code, json={})
+            httpx_mock.add_response(method="POST", status_code=code, headers={"retry-after": "3"}, json={})
             with AsyncResponseGenerator(self.model, self.inputs, generate_params, self.service) as asynchelper:
                 time_start = time.time()
                 for result in asynchelper.generate_response():
@@ -150,12 +150,35 @@ class TestAsyncResponseGenerator:
                 assert time_end - time_start > 5
         ConnectionManager.MAX_RETRIES_GENERATE = saved
 
+    @pytest.mark.asyncio
+    async def test_concurrent_generate_rate_limited_then_succeeds(self, httpx_mock, generate_params):
+        num_prompts = 2 * ConnectionManager.MAX_CONCURRENT_GENERATE
+        inputs = ["Input " + str(i) for i in range(num_prompts)]
+        seen = set()
+
+        def first_attempt_throttled(request: httpx.Request):
+            body = orjson.loads(request.content)
+            if body["inputs"][0] not in seen:
+                seen.add(body["inputs"][0])
+                return httpx.Response(status_code=httpx.codes.TOO_MANY_REQUESTS, headers={"retry-after": "0"}, json={})
+            return httpx.Response(
+                status_code=200, json=SimpleResponse.generate(model=self.model, inputs=body["inputs"])
+            )
+
+        httpx_mock.add_callback(first_attempt_throttled, method="POST")
+        with AsyncResponseGenerator(self.model, inputs, generate_params, self.service) as asynchelper:
+            results = list(asynchelper.generate_response())
+        assert len(results) == num_prompts
+        assert all(result is not None for result in results)
+        assert not ConnectionManager.generate_circuit_open()
+        assert ConnectionManager._consecutive_failures == 0
+
     @pytest.mark.asyncio
     async def test_concurrent_tokenize_retry(self, httpx_mock, tokenize_params):
         saved = ConnectionManager.MAX_RETRIES_TOKENIZE
         ConnectionManager.MAX_RETRIES_TOKENIZE = 2
         for code in [httpx.codes.SERVICE_UNAVAILABLE, httpx.codes.TOO_MANY_REQUESTS]:
-            httpx_mock.add_response(method="POST", status_code=code, json={})
+            httpx_mock.add_response(method="POST", status_code=code, headers={"retry-after": "3"}, json={})
             with AsyncResponseGenerator(
                 self.model, self.inputs, tokenize_params, self.service, fn="tokenize"
             ) as asynchelper:
@@ -179,9 +202,7 @@ class TestAsyncResponseGenerator:
         )
         # Following two lines: Selected input id should return 429, others should succeed
         httpx_mock.add_response(method="POST", json=single_response)
-        httpx_mock.add_response(
-            method="POST", status_code=429, match_content=bytes(json.dumps(json_data), encoding="utf-8")
-        )
+        httpx_mock.add_response(method="POST", status_code=429, match_content=orjson.dumps(json_data))
         num_prompts = 9
         counter = 0
         inputs = ["Input " + str(i) for i in range(num_prompts)]
@@ -391,3 +412,20 @@ class TestAsyncResponseGenerator:
                         num_results += 1
                 assert num_prompts == num_results
             assert ConnectionManager.async_tokenize_client is None
+
+    def test_new_event_loop_without_uvloop(self, monkeypatch):
+        monkeypatch.setattr(ConnectionManager, "USE_UVLOOP", False)
+        loop = ConnectionManager.new_event_loop()
+        try:
+            assert type(loop).__module__.startswith("asyncio")
+        finally:
+            loop.close()
+
+    def test_new_event_loop_with_uvloop(self, monkeypatch):
+        uvloop = pytest.importorskip("uvloop")
+        monkeypatch.setattr(ConnectionManager, "USE_UVLOOP", True)
+        loop = ConnectionManager.new_event_loop()
+        try:
+            assert isinstance(loop, uvloop.Loop)
+        finally:
+            loop.close()
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 
 from genai import Credentials, Model
@@ -44,8 +45,7 @@ class TestModel:
         GENERATE_RESPONSE = SimpleResponse.generate(model=ModelType.FLAN_UL2, inputs=prompts, params=params)
         expected_generated_response = GenerateResponse(**GENERATE_RESPONSE)
 
-        response = MagicMock(status_code=200)
-        response.json.return_value = GENERATE_RESPONSE
+        response = MagicMock(status_code=200, content=orjson.dumps(GENERATE_RESPONSE))
         mocked_post_request.return_value = response
 
         model = Model(ModelType.FLAN_UL2, params=params, credentials=credentials)
@@ -57,6 +57,46 @@ class TestModel:
         for i, response in enumerate(responses_list):
             assert response.input_text == prompts[i]
 
+    @patch("genai.services.RequestHandler.post")
+    def test_generate_stream(self, mocked_post_request, credentials, params, prompts):
+        """Tests that streamed byte chunks are parsed into GenerateStreamResponse"""
+
+        mocked_post_request.return_value = iter(
+            [b'data: {"results": [{"generated_text": " are", "generated_token_count": 1}]}\n\n']
+        )
+
+        model = Model(ModelType.FLAN_UL2, params=params, credentials=credentials)
+        responses = list(model.generate_stream(prompts=prompts[:1]))
+
+        assert len(responses) == 1
+        assert responses[0].generated_text == " are"
+
+    @patch("genai.services.RequestHandler.post")
+    def test_generate_stream_multibyte_split(self, mocked_post_request, credentials, params, prompts):
+        """Tests that a multibyte character split across chunks doesn't abort the stream"""
+
+        event = 'data: {"results": [{"generated_text": "café"}]}\n\n'.encode("utf-8")
+        split = event.index("é".encode("utf-8")) + 1
+        mocked_post_request.return_value = iter([event[:split], event[split:], event])
+
+        model = Model(ModelType.FLAN_UL2, params=params, credentials=credentials)
+        responses = list(model.generate_stream(prompts=prompts[:1]))
+
+        assert [response.generated_text for response in responses] == ["café"]
+
+    @patch("genai.services.RequestHandler.post")
+    def test_generate_stream_flushes_incomplete_tail(self, mocked_post_request, credentials, params, prompts, caplog):
+        """Tests that an incomplete UTF-8 sequence at the end of the stream is flushed as a replacement character"""
+
+        event = 'data: {"results": [{"generated_text": "ok"}]}\n\n'.encode("utf-8")
+        mocked_post_request.return_value = iter([event + "é".encode("utf-8")[:1]])
+
+        model = Model(ModelType.FLAN_UL2, params=params, credentials=credentials)
+        responses = list(model.generate_stream(prompts=prompts[:1]))
+
+        assert [response.generated_text for response in responses] == ["ok"]
+        assert "Could not parse \ufffd" in caplog.text
+
     @patch("genai.services.RequestHandler.post")
     def test_generate_throws_exception_for_non_200(self, mock_service_generate, credentials, params, prompts):
         """Tests that the GenAiException is thrown if the status code is not 200"""
@@ -83,8 +123,7 @@ class TestModel:
         TOKENIZE_RESPONSE = SimpleResponse.tokenize(model=ModelType.FLAN_UL2, inputs=["a", "b", "c"])
         expected_token_response = TokenizeResponse(**TOKENIZE_RESPONSE)
 
-        mock_response = MagicMock(status_code=200)
-        mock_response.json.return_value = TOKENIZE_RESPONSE
+        mock_response = MagicMock(status_code=200, content=orjson.dumps(TOKENIZE_RESPONSE))
         mocked_post_request.return_value = mock_response
 
         model = Model(ModelType.FLAN_UL2, params=params, credentials=credentials)
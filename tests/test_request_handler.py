@@ -1,9 +1,31 @@
+import asyncio
+import gc
+import json
+import weakref
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
+from aiohttp import web
 
+from genai.exceptions import GenAiException
+from genai.options import Options
 from genai.schemas import GenerateParams
 from genai.services import RequestHandler, ServiceInterface
+from genai.services.connection_manager import ConnectionManager
+from genai.services.request_handler import _retry_delay
+
+
+async def _serve_generate(handler):
+    app = web.Application()
+    app.router.add_post("/generate", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/generate"
 
 
 @pytest.mark.unit
@@ -33,11 +55,43 @@ class TestRequestHandler:
             "parameters": {"decoding_method": "greedy"},
         }
 
+    def test_metadata_post_with_options(self):
+        _, json_data = RequestHandler._metadata(
+            method="POST", key="API_KEY", model_id=self.model, inputs=self.inputs, options=Options(prompt_id="abc")
+        )
+
+        assert json_data == {"model_id": self.model, "inputs": self.inputs, "prompt_id": "abc"}
+
     def test_metadata_get(self):
-        headers, _ = RequestHandler._metadata(method="GET", key="API_KEY")
+        headers, json_data = RequestHandler._metadata(method="GET", key="API_KEY")
 
         assert "Authorization" in headers
         assert headers["Authorization"] == "Bearer API_KEY"
+        assert "Content-Type" not in headers
+        assert json_data is None
+
+    def test_metadata_headers_not_shared(self):
+        headers, _ = RequestHandler._metadata(method="PATCH", key="API_KEY")
+        headers["Authorization"] = "Bearer OTHER_KEY"
+
+        headers, _ = RequestHandler._metadata(method="PATCH", key="API_KEY")
+        assert headers["Authorization"] == "Bearer API_KEY"
+        assert headers["Content-Type"] == "application/json"
+
+    def test_serialize(self, params):
+        _, json_data = RequestHandler._metadata(
+            method="POST", key="API_KEY", model_id=self.model, inputs=self.inputs, parameters=params
+        )
+
+        content = RequestHandler.serialize(json_data)
+
+        assert isinstance(content, bytes)
+        assert json.loads(content) == json_data
+
+    def test_serialize_non_str_keys_and_big_ints(self):
+        content = RequestHandler.serialize({"parameters": {1: "a"}, "seed": 2**70})
+
+        assert json.loads(content) == {"parameters": {"1": "a"}, "seed": 2**70}
 
     @patch("httpx.Client.get")
     def test_get(self, mock: MagicMock):
@@ -58,3 +112,252 @@ class TestRequestHandler:
         toekn = s.tokenize(model="model", inputs=["input"])
 
         assert toekn == expected_resp
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.get")
+    async def test_async_get_uses_shared_client(self, mock: MagicMock):
+        expected_resp = {"some": "history"}
+        mock.return_value = expected_resp
+
+        s = ServiceInterface(service_url="SERVICE_URL", api_key="KEY")
+        his = await s.async_history(params={"limit": 1})
+
+        assert his == expected_resp
+        assert mock.call_count == 1
+        assert not ConnectionManager.get_async_client().is_closed
+        await ConnectionManager.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_within_loop(self):
+        client = ConnectionManager.get_async_client()
+
+        assert ConnectionManager.get_async_client() is client
+
+        await ConnectionManager.aclose()
+        assert client.is_closed
+        assert ConnectionManager.async_client is None
+
+    def test_async_client_recreated_for_new_loop(self):
+        async def get_client():
+            return ConnectionManager.get_async_client()
+
+        async def get_client_and_close():
+            client = ConnectionManager.get_async_client()
+            await ConnectionManager.aclose()
+            return client
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client_and_close())
+
+        assert first is not second
+        assert second.is_closed
+        assert ConnectionManager.async_client is None
+
+    def test_async_clients_not_retained_across_loops(self):
+        async def get_client_ref():
+            return weakref.ref(ConnectionManager.get_async_client())
+
+        refs = [asyncio.run(get_client_ref()) for _ in range(5)]
+        ConnectionManager.reset_for_event_loop()
+        gc.collect()
+
+        assert all(ref() is None for ref in refs)
+        assert ConnectionManager.async_client is None
+
+    def test_bind_post_json(self, httpx_mock):
+        httpx_mock.add_response(method="POST", match_content=b'{"inputs":["a"]}', json={"results": []})
+
+        sender = RequestHandler.bind("http://service_url/tokenize", key="KEY")
+        response = sender.post_json(RequestHandler.serialize({"inputs": ["a"]}))
+
+        assert response.json() == {"results": []}
+        request = httpx_mock.get_request()
+        assert request.headers["Authorization"] == "Bearer KEY"
+        assert request.headers["Content-Type"] == "application/json"
+
+    def test_sync_client_usable_after_close(self, httpx_mock):
+        httpx_mock.add_response(method="GET", json={"some": "history"})
+        old_client = ConnectionManager.sync_client
+
+        ConnectionManager.close()
+        response = RequestHandler.get("http://service_url/requests", key="KEY")
+
+        assert old_client.is_closed
+        assert response.json() == {"some": "history"}
+
+    def test_patch_sends_payload(self, httpx_mock):
+        httpx_mock.add_response(method="PATCH", match_content=b'{"tou_accepted":true}', json={})
+
+        s = ServiceInterface(service_url="http://service_url", api_key="KEY")
+        response = s.terms_of_use(True)
+
+        assert response.status_code == 200
+
+    def test_post_stream(self, httpx_mock):
+        httpx_mock.add_response(method="POST", content=b"data: chunk")
+
+        chunks = RequestHandler.post(endpoint="http://service_url/generate", key="KEY", streaming=True)
+
+        assert b"".join(chunks) == b"data: chunk"
+        assert not ConnectionManager.sync_client.is_closed
+
+    def test_retry_delay_honors_retry_after(self):
+        response = httpx.Response(status_code=429, headers={"Retry-After": "7"})
+
+        assert _retry_delay(response, attempt=0) == 7.0
+
+    def test_retry_delay_full_jitter(self):
+        response = httpx.Response(status_code=503)
+
+        for attempt in range(3):
+            assert 0 <= _retry_delay(response, attempt=attempt) <= 2 ** (attempt + 1)
+
+    def test_retry_delay_is_capped(self):
+        response = httpx.Response(status_code=503)
+
+        assert _retry_delay(response, attempt=20) <= ConnectionManager.MAX_RETRY_BACKOFF
+
+    @pytest.mark.asyncio
+    @patch("httpx.AsyncClient.post")
+    async def test_async_generate_circuit_open(self, mock: MagicMock):
+        ConnectionManager.make_generate_client()
+        try:
+            for _ in range(ConnectionManager.CIRCUIT_BREAKER_THRESHOLD):
+                ConnectionManager.record_generate_failure()
+
+            with pytest.raises(GenAiException, match="Too many consecutive failed generate requests"):
+                await RequestHandler.async_generate("http://service_url/generate", key="KEY", inputs=self.inputs)
+            mock.assert_not_called()
+
+            ConnectionManager.record_generate_success()
+            assert not ConnectionManager.generate_circuit_open()
+        finally:
+            ConnectionManager.record_generate_success()
+            await ConnectionManager.delete_generate_client()
+
+    @pytest.mark.asyncio
+    async def test_async_generate_circuit_counts_only_unavailable(self, httpx_mock):
+        httpx_mock.add_response(method="POST", status_code=429, headers={"retry-after": "0"}, json={})
+        httpx_mock.add_response(method="POST", status_code=503, headers={"retry-after": "0"}, json={})
+        httpx_mock.add_response(method="POST", status_code=503, headers={"retry-after": "0"}, json={})
+        ConnectionManager.make_generate_client()
+        try:
+            response = await RequestHandler.async_generate("http://service_url/generate", key="KEY", inputs=self.inputs)
+            assert response.status_code == 503
+            assert ConnectionManager._consecutive_failures == ConnectionManager.MAX_RETRIES_GENERATE - 1
+        finally:
+            await ConnectionManager.delete_generate_client()
+        ConnectionManager.make_generate_client()
+        assert ConnectionManager._consecutive_failures == 0
+        await ConnectionManager.delete_generate_client()
+
+    @pytest.mark.asyncio
+    async def test_async_generate_circuit_not_reset_by_other_errors(self, httpx_mock):
+        # 502 and 504 are returned as is, the 503 is retried and answered with a 500
+        for status in [502, 503, 500, 504]:
+            httpx_mock.add_response(method="POST", status_code=status, headers={"retry-after": "0"}, json={})
+        ConnectionManager.make_generate_client()
+        try:
+            for _ in range(3):
+                await RequestHandler.async_generate("http://service_url/generate", key="KEY", inputs=self.inputs)
+            assert ConnectionManager._consecutive_failures == 3
+        finally:
+            await ConnectionManager.delete_generate_client()
+
+    @pytest.mark.asyncio
+    @patch("genai.services.connection_manager.ConnectionManager.TIMEOUT_GENERATE", 0.2)
+    async def test_async_generate_aiohttp_timeout_counts_as_failure(self):
+        async def slow_handler(request):
+            await asyncio.sleep(1)
+            return web.json_response({})
+
+        runner, url = await _serve_generate(slow_handler)
+        ConnectionManager.make_generate_client()
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await RequestHandler.async_generate_aiohttp(url, key="KEY", inputs=self.inputs)
+            assert ConnectionManager._consecutive_failures == 1
+        finally:
+            await ConnectionManager.delete_generate_client()
+            await runner.cleanup()
+
+    @pytest_asyncio.fixture
+    async def aiohttp_server_url(self):
+        attempts = []
+
+        async def handler(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                return web.json_response({}, status=429, headers={"Retry-After": "0"})
+            return web.json_response(
+                {
+                    "body": await request.json(),
+                    "authorization": request.headers["Authorization"],
+                    "content_type": request.headers["Content-Type"],
+                    "attempts": len(attempts),
+                }
+            )
+
+        runner, url = await _serve_generate(handler)
+        yield url
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_async_generate_aiohttp(self, aiohttp_server_url):
+        try:
+            response = await RequestHandler.async_generate_aiohttp(
+                aiohttp_server_url, key="KEY", model_id=self.model, inputs=self.inputs
+            )
+            session = ConnectionManager.get_generate_session()
+        finally:
+            await ConnectionManager.delete_generate_client()
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "body": {"model_id": self.model, "inputs": self.inputs},
+            "authorization": "Bearer KEY",
+            "content_type": "application/json",
+            "attempts": 2,
+        }
+        assert session.closed
+        assert ConnectionManager.async_generate_session is None
+
+    @pytest.mark.asyncio
+    async def test_async_generate_aiohttp_error_response(self):
+        error = {"status_code": 400, "error": "Bad Request", "message": "Invalid model_id"}
+
+        async def handler(request):
+            return web.json_response(error, status=400)
+
+        runner, url = await _serve_generate(handler)
+        try:
+            response = await RequestHandler.async_generate_aiohttp(url, key="KEY", inputs=self.inputs)
+        finally:
+            await ConnectionManager.delete_generate_client()
+            await runner.cleanup()
+
+        assert isinstance(response, httpx.Response)
+        assert response.status_code == 400
+        assert GenAiException(response).error_message == "Invalid model_id"
+
+    def test_generate_session_recreated_for_new_loop(self):
+        async def get_session():
+            return ConnectionManager.get_generate_session()
+
+        async def get_session_and_close():
+            session = ConnectionManager.get_generate_session()
+            await ConnectionManager.delete_generate_client()
+            return session
+
+        first = asyncio.run(get_session())
+        second = asyncio.run(get_session_and_close())
+
+        assert first is not second
+        assert first.closed
+        assert second.closed
+
+    @patch("genai.services.connection_manager.ConnectionManager.USE_AIOHTTP_GENERATE", True)
+    def test_make_generate_client_skips_httpx_for_aiohttp(self):
+        ConnectionManager.make_generate_client()
+
+        assert ConnectionManager.async_generate_client is None
@@ -53,6 +53,19 @@ class TestServiceInterfaceAsync:
         with pytest.raises(TypeError):
             await self.service.async_generate()
 
+    @pytest.mark.asyncio
+    @patch("genai.services.connection_manager.ConnectionManager.USE_AIOHTTP_GENERATE", True)
+    @patch("genai.services.RequestHandler.async_generate_aiohttp")
+    async def test_generate_async_aiohttp_backend(self, mock: AsyncMock):
+        expected_resp = SimpleResponse.generate(model=self.model, inputs=self.inputs)
+        expected = AsyncMock(status_code=200, json=expected_resp)
+
+        mock.return_value = expected
+        resp = await self.service.async_generate(model=self.model, inputs=self.inputs)
+
+        assert resp == expected
+        mock.assert_awaited_once()
+
     # TOKENIZE  ASYNC
     @pytest.mark.asyncio
     @patch("genai.services.RequestHandler.async_tokenize")
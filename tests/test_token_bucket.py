@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+import pytest
+
+from genai.services.token_bucket import AsyncTokenBucket
+
+
+@pytest.mark.unit
+class TestAsyncTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity(self):
+        bucket = AsyncTokenBucket(capacity=3, refill_amount=3, refill_frequency=60)
+
+        time_start = time.time()
+        for _ in range(3):
+            async with bucket:
+                pass
+        assert time.time() - time_start < 0.5
+
+        await bucket.close()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill(self):
+        bucket = AsyncTokenBucket(capacity=2, refill_amount=2, refill_frequency=0.2)
+
+        time_start = time.time()
+        for _ in range(5):
+            await bucket.acquire()
+        assert time.time() - time_start >= 0.4
+
+        await bucket.close()
+
+    @pytest.mark.asyncio
+    async def test_refill_never_exceeds_capacity(self):
+        bucket = AsyncTokenBucket(capacity=2, refill_amount=5, refill_frequency=0.05)
+        await bucket.acquire()
+        await asyncio.sleep(0.2)
+
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket._semaphore.locked()
+
+        await bucket.close()
@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from genai.exceptions import GenAiException
+from genai.services import AsyncTokenizeBatcher, ServiceInterface
+from genai.services.connection_manager import ConnectionManager
+from tests.assets.response_helper import SimpleResponse
+
+
+@pytest.mark.unit
+class TestAsyncTokenizeBatcher:
+    def setup_method(self):
+        self.service = ServiceInterface(service_url="http://SERVICE_URL", api_key="API_KEY")
+        self.model = "google/ul2"
+
+    @pytest.fixture
+    def mock_tokenize(self, mocker):
+        def side_effect(model, inputs, params, options):
+            response = SimpleResponse.tokenize(model=model, inputs=inputs)
+            return MagicMock(status_code=200, content=orjson.dumps(response))
+
+        return mocker.patch.object(self.service, "async_tokenize", AsyncMock(side_effect=side_effect))
+
+    @pytest.mark.asyncio
+    async def test_coalesces_inputs(self, mock_tokenize):
+        inputs = ["a b", "c", "d e f"]
+        async with AsyncTokenizeBatcher(self.model, self.service) as batcher:
+            assert ConnectionManager.async_tokenize_client is not None
+            results = await asyncio.gather(*[batcher.tokenize(text) for text in inputs])
+        assert ConnectionManager.async_tokenize_client is None
+
+        assert mock_tokenize.await_count == 1
+        assert [result.input_text for result in results] == inputs
+        assert [result.token_count for result in results] == [2, 1, 3]
+
+    @pytest.mark.asyncio
+    async def test_splits_at_max_batch(self, mock_tokenize):
+        inputs = [str(i) for i in range(7)]
+        async with AsyncTokenizeBatcher(self.model, self.service, max_batch=3) as batcher:
+            results = await asyncio.gather(*[batcher.tokenize(text) for text in inputs])
+
+        assert mock_tokenize.await_count == 3
+        assert [result.input_text for result in results] == inputs
+
+    @pytest.mark.asyncio
+    async def test_error_is_propagated(self, mocker):
+        mocker.patch.object(self.service, "async_tokenize", AsyncMock(side_effect=Exception("oh no")))
+        async with AsyncTokenizeBatcher(self.model, self.service) as batcher:
+            with pytest.raises(GenAiException, match="oh no"):
+                await batcher.tokenize("a")